@@ -22,7 +22,7 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
-from utils.browser import get_driver, close_driver
+from utils.browser import acquire_driver, release_driver, close_driver_pool
 from config import UNIVERSITY_INFO
 
 # 创建全局 Console 实例
@@ -94,7 +94,7 @@ class BaseSpider(ABC):
         if self._driver is None:
             # 简化启动过程，避免 rich console 干扰
             print("🌐 正在启动浏览器 (Browser Launching)...")
-            self._driver = get_driver(self.headless)
+            self._driver = acquire_driver(self.headless)
         return self._driver
     
     @property
@@ -153,14 +153,17 @@ class BaseSpider(ABC):
     
     def close(self) -> None:
         """
-        关闭浏览器，释放资源
+        归还浏览器，释放资源
         
-        在完成爬取后必须调用此方法来清理资源
+        在完成爬取后必须调用此方法来清理资源。无头模式的浏览器重置后留在驱动池中供后续复用；
+        有头模式则关闭池中所有有头实例（包括子类临时借出后归还的），不在桌面上残留窗口
         """
         if self._driver is not None:
-            print("🔒 正在关闭浏览器...")
-            close_driver(self._driver)
+            print("♻️ 正在归还浏览器..." if self.headless else "🔒 正在关闭浏览器...")
+            release_driver(self._driver, self.headless)
             self._driver = None
+        if not self.headless:
+            close_driver_pool(headless=False)
     
     def get_elapsed_time(self) -> float:
         """
@@ -154,7 +154,7 @@ class CityUSpider(BaseSpider):
         # 这里的 fetch_details 设计需要遵循 CrawlerProgress 的模式
         # 我们使用临时 driver
         
-        from utils.browser import get_driver, close_driver
+        from utils.browser import acquire_driver, release_driver
         
         start_time = time.time()
         result = self.create_result_template(item["name"], item["link"])
@@ -162,7 +162,7 @@ class CityUSpider(BaseSpider):
         
         # 启动临时浏览器
         # CityU 详情页也需要 Headful 模式
-        driver = get_driver(headless=False)
+        driver = acquire_driver(headless=False)
         
         try:
             driver.get(item['link'])
@@ -192,7 +192,7 @@ class CityUSpider(BaseSpider):
         except Exception as e:
             result["_error"] = str(e)
         finally:
-            close_driver(driver)
+            release_driver(driver, headless=False)
             
         duration = time.time() - start_time
         return result, duration
@@ -4,7 +4,7 @@
 包含浏览器驱动管理、数据保存、进度显示和 Selenium 通用操作
 """
 
-from .browser import get_driver
+from .browser import get_driver, prewarm_drivers, acquire_driver, release_driver, reset_driver
 from .data_saver import save_excel, save_csv, preview_data, preview_full_data
 from .progress import CrawlerProgress, print_phase_start, print_phase_complete
 from .selenium_utils import (
@@ -15,6 +15,8 @@ from .selenium_utils import (
     safe_click,
     wait_and_get_text,
     wait_and_get_attribute,
+    get_many,
+    execute_many,
     switch_to_new_window_and_get_url,
     extract_final_apply_url
 )
@@ -22,6 +24,10 @@ from .selenium_utils import (
 __all__ = [
     # 浏览器管理
     'get_driver',
+    'prewarm_drivers',
+    'acquire_driver',
+    'release_driver',
+    'reset_driver',
     'BrowserPool',
     'get_browser_pool',
     'close_browser_pool',
@@ -39,6 +45,8 @@ __all__ = [
     'safe_click',
     'wait_and_get_text',
     'wait_and_get_attribute',
+    'get_many',
+    'execute_many',
     'switch_to_new_window_and_get_url',
     'extract_final_apply_url'
 ]
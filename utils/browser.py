@@ -6,20 +6,63 @@
 
 import os
 import json
+import atexit
 import random
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Optional, TYPE_CHECKING
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 
+if TYPE_CHECKING:
+    from utils.selenium_utils import BrowserPool
+
 # 解决 SSL 证书验证失败导致无法下载驱动的问题
 os.environ['WDM_SSL_VERIFY'] = '0'
 
 # 缓存 ChromeDriver 路径，避免重复下载检查
 _cached_driver_path = None
 
+# 驱动池（按 headless 模式分开存放，避免取到模式不符的实例），首次使用时创建
+_driver_pools: Dict[bool, "BrowserPool"] = {}
+_driver_pools_lock = threading.Lock()
+
+# 每种模式最多保留的空闲实例数，超出的实例归还时直接关闭
+_DRIVER_POOL_SIZE = 4
+
+# 清除当前页面的 localStorage / sessionStorage（about:blank 等页面访问会抛异常，忽略即可）
+_CLEAR_STORAGE_JS = "try{window.localStorage.clear();window.sessionStorage.clear();}catch(e){}"
+
+# get_driver 设置的隐式等待与页面加载超时（秒），reset_driver 复用实例时恢复为这两个值
+_IMPLICIT_WAIT = 5
+_PAGE_LOAD_TIMEOUT = 30
+
+# 需要关闭的 Chrome 功能（Chrome 只认最后一个 --disable-features 参数，必须合并成一个）
+# 这些后台服务在无头模式下同样会在启动时建立连接、占用线程
+_DISABLED_FEATURES = [
+    "VizDisplayCompositor",
+    "Translate",
+    "MediaRouter",
+    "OptimizationHints",
+    "InterestFeedContentSuggestions",
+    "CalculateNativeWinOcclusion",
+    "BackForwardCache",
+]
+
 # #region agent log
+# 调试日志序列化：优先使用 orjson（C 实现，直接输出 UTF-8 字节），未安装时回退到标准库 json
+try:
+    import orjson
+
+    def _dumps_line(obj) -> bytes:
+        return orjson.dumps(obj) + b"\n"
+except ImportError:
+    def _dumps_line(obj) -> bytes:
+        return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
 _DEBUG_LOG_PATH = r"d:\Project\MySpiderProject\.cursor\debug.log"
 def _debug_log(hypothesis_id, location, message, data=None):
     import time
@@ -33,14 +76,14 @@ def _debug_log(hypothesis_id, location, message, data=None):
             
     entry = {"hypothesisId": hypothesis_id, "location": location, "message": message, "data": data or {}, "timestamp": int(time.time()*1000), "sessionId": "debug-session"}
     try:
-        with open(_DEBUG_LOG_PATH, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        with open(_DEBUG_LOG_PATH, "ab") as f:
+            f.write(_dumps_line(entry))
     except Exception:
         pass  # Fail silently if cannot write to log
 # #endregion
 
 
-def get_driver(headless: bool = True, fast_mode: bool = True) -> webdriver.Chrome:
+def get_driver(headless: bool = True, fast_mode: bool = True, disable_media: bool = False) -> webdriver.Chrome:
     """
     创建并返回一个配置好的 Chrome WebDriver 实例
     
@@ -49,6 +92,7 @@ def get_driver(headless: bool = True, fast_mode: bool = True) -> webdriver.Chrom
             - True: 后台运行，看不到浏览器窗口（默认，推荐用于批量抓取）
             - False: 前台运行，可以看到浏览器窗口（用于调试）
         fast_mode (bool): 是否启用快速模式（禁用更多资源加载）
+        disable_media (bool): 是否禁止加载图片和自动播放媒体（只提取文本/链接时可开启，加快页面加载）
     
     返回:
         webdriver.Chrome: 配置好的 Chrome 驱动实例
@@ -59,7 +103,7 @@ def get_driver(headless: bool = True, fast_mode: bool = True) -> webdriver.Chrom
         >>> driver.quit()
     """
     # #region agent log
-    _debug_log("START", "browser.py:entry", "get_driver called", {"headless": headless, "fast_mode": fast_mode})
+    _debug_log("START", "browser.py:entry", "get_driver called", {"headless": headless, "fast_mode": fast_mode, "disable_media": disable_media})
     # #endregion
     
     global _cached_driver_path
@@ -77,7 +121,7 @@ def get_driver(headless: bool = True, fast_mode: bool = True) -> webdriver.Chrom
     # 关键稳定性配置
     # chrome_options.add_argument("--remote-debugging-port=0")  # Removed: causing crash on some systems
     # chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+    chrome_options.add_argument("--disable-features=" + ",".join(_DISABLED_FEATURES))
     
     # 强制使用唯一临时配置目录，彻底解决冲突
     # user_data_dir = tempfile.mkdtemp(prefix="chrome_test_")
@@ -88,6 +132,11 @@ def get_driver(headless: bool = True, fast_mode: bool = True) -> webdriver.Chrom
     chrome_options.add_argument("--disable-popup-blocking")
     chrome_options.add_argument("--log-level=3")
     
+    # 禁止后台节流（池中的实例大多处于后台窗口，节流会拖慢页面脚本执行）
+    chrome_options.add_argument("--disable-background-timer-throttling")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+    chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+    
     # --- 无头模式配置 ---
     if headless:
         # #region agent log
@@ -103,10 +152,13 @@ def get_driver(headless: bool = True, fast_mode: bool = True) -> webdriver.Chrom
     # chrome_options.add_experimental_option("useAutomationExtension", False)
     
     # 基础 prefs - 仅禁用图片以加速
-    # prefs = {
-    #     "profile.managed_default_content_settings.images": 2,
-    # }
-    # chrome_options.add_experimental_option("prefs", prefs)
+    if disable_media:
+        prefs = {
+            "profile.managed_default_content_settings.images": 2,
+        }
+        chrome_options.add_experimental_option("prefs", prefs)
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--autoplay-policy=user-gesture-required")
     
     # --- 创建驱动实例 ---
     # 使用 webdriver_manager 自动管理驱动 (更稳健)
@@ -134,7 +186,8 @@ def get_driver(headless: bool = True, fast_mode: bool = True) -> webdriver.Chrom
     # #endregion
     
     try:
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        # 显式开启 keep-alive：所有 WebDriver 命令复用同一条到 chromedriver 的 HTTP 连接
+        driver = webdriver.Chrome(service=service, options=chrome_options, keep_alive=True)
         # #region agent log
         _debug_log("C", "browser.py:after_create", "Chrome driver created successfully", {})
         # #endregion
@@ -160,12 +213,12 @@ def get_driver(headless: bool = True, fast_mode: bool = True) -> webdriver.Chrom
     
     # 减少隐式等待时间
     # #region agent log
-    _debug_log("E", "browser.py:wait_config", "Setting wait times", {"implicit": 5, "page_load": 30})
+    _debug_log("E", "browser.py:wait_config", "Setting wait times", {"implicit": _IMPLICIT_WAIT, "page_load": _PAGE_LOAD_TIMEOUT})
     # #endregion
-    driver.implicitly_wait(5)
+    driver.implicitly_wait(_IMPLICIT_WAIT)
     
     # 设置页面加载超时
-    driver.set_page_load_timeout(30)
+    driver.set_page_load_timeout(_PAGE_LOAD_TIMEOUT)
     
     # #region agent log
     _debug_log("ALL", "browser.py:return", "Driver ready", {})
@@ -186,3 +239,124 @@ def close_driver(driver: webdriver.Chrome) -> None:
         except Exception as e:
             print(f"⚠️ 关闭浏览器时出错: {e}")
 
+
+
+def reset_driver(driver: webdriver.Chrome) -> None:
+    """
+    清空浏览器状态以便复用，代替 quit() 后重新启动
+    
+    关闭额外窗口，清除当前页面的本地存储，通过 CDP 清除 cookies 和缓存，跳转到空白页，
+    并把调用方可能改过的隐式等待、页面加载超时恢复为 get_driver 的设置
+    
+    参数:
+        driver (webdriver.Chrome): 需要重置的驱动实例
+    """
+    handles = driver.window_handles
+    if len(handles) > 1:
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+    driver.switch_to.window(handles[0])
+    # 离开页面前清除其 localStorage / sessionStorage，避免带入下一个使用方
+    driver.execute_script(_CLEAR_STORAGE_JS)
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    driver.get("about:blank")
+    driver.implicitly_wait(_IMPLICIT_WAIT)
+    driver.set_page_load_timeout(_PAGE_LOAD_TIMEOUT)
+
+
+def _get_pool(headless: bool) -> "BrowserPool":
+    """
+    获取指定模式的驱动池，不存在时创建
+    """
+    # selenium_utils 在模块级导入本模块，这里延迟导入以避免循环导入
+    from utils.selenium_utils import BrowserPool
+    
+    with _driver_pools_lock:
+        pool = _driver_pools.get(headless)
+        if pool is None:
+            pool = _driver_pools[headless] = BrowserPool(size=_DRIVER_POOL_SIZE, headless=headless)
+        return pool
+
+
+def prewarm_drivers(n: int, headless: bool = True) -> int:
+    """
+    并行预启动 n 个 Chrome 实例放入驱动池
+    
+    Chrome 冷启动约 1~2 秒，串行创建时耗时线性叠加；
+    这里用线程池同时启动，后续 acquire_driver() 可直接取用
+    
+    参数:
+        n (int): 预启动的实例数量（最多 _DRIVER_POOL_SIZE 个）
+        headless (bool): 是否无头模式
+    
+    返回:
+        int: 池中空闲的实例数量
+    """
+    pool = _get_pool(headless)
+    n = min(n, _DRIVER_POOL_SIZE)
+    if n <= 0:
+        return pool.idle
+    
+    # 全部借出后再统一归还，避免先启动完的实例被后面的 acquire 取走、实际启动数不足 n
+    drivers = []
+    with ThreadPoolExecutor(max_workers=n) as executor:
+        futures = [executor.submit(pool.acquire) for _ in range(n)]
+        for future in as_completed(futures):
+            try:
+                drivers.append(future.result())
+            except Exception as e:
+                print(f"⚠️ 预热浏览器失败: {e}")
+    for driver in drivers:
+        pool.release(driver, dirty=False)
+    return pool.idle
+
+
+def acquire_driver(headless: bool = True) -> webdriver.Chrome:
+    """
+    从驱动池取出一个已启动的实例，池为空时现场创建
+    
+    参数:
+        headless (bool): 是否无头模式
+    
+    返回:
+        webdriver.Chrome: 可用的驱动实例（用完后调用 release_driver 归还）
+    """
+    return _get_pool(headless).acquire()
+
+
+def release_driver(driver: webdriver.Chrome, headless: bool = True) -> None:
+    """
+    重置状态后将驱动归还到驱动池，供下一个调用方直接复用；重置失败则直接关闭
+    
+    参数:
+        driver (webdriver.Chrome): 需要归还的驱动实例
+        headless (bool): 该实例创建时使用的模式
+    """
+    if not driver:
+        return
+    try:
+        reset_driver(driver)
+        healthy = True
+    except Exception:
+        healthy = False
+    # reset_driver 已完成清理，归还时不再重复清理
+    _get_pool(headless).release(driver, dirty=False, discard=not healthy)
+
+
+def close_driver_pool(headless: Optional[bool] = None) -> None:
+    """
+    关闭驱动池中的实例（进程退出时自动调用，关闭全部）
+    
+    参数:
+        headless (bool): 只关闭该模式的驱动池；None 表示关闭全部
+    """
+    with _driver_pools_lock:
+        modes = list(_driver_pools) if headless is None else [headless]
+        pools = [_driver_pools.pop(mode) for mode in modes if mode in _driver_pools]
+    for pool in pools:
+        pool.close_all()
+
+
+atexit.register(close_driver_pool)
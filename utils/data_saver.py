@@ -5,6 +5,7 @@
 """
 
 import os
+import csv
 import sys
 from datetime import datetime
 from typing import List, Dict, Optional
@@ -13,7 +14,7 @@ import pandas as pd
 
 # 尝试导入 rich 库用于美化输出
 try:
-    from rich.console import Console
+    from rich.console import Console, Group
     from rich.table import Table
     from rich.panel import Panel
     from rich.text import Text
@@ -24,6 +25,13 @@ except ImportError:
     RICH_AVAILABLE = False
     rich_escape = lambda x: x  # 降级：不转义
 
+# 优先使用 xlsxwriter 写 Excel（纯写入场景比 openpyxl 快），未安装时回退到 openpyxl
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
 from config import EXCEL_COLUMNS, OUTPUT_DIR, FILENAME_TEMPLATE
 
 
@@ -73,9 +81,12 @@ def ensure_output_dir(output_dir: str = OUTPUT_DIR) -> str:
     返回:
         str: 输出目录的绝对路径
     """
-    if not os.path.exists(output_dir):
+    # 直接创建，已存在时由 FileExistsError 判断，省去一次 exists 检查
+    try:
         os.makedirs(output_dir)
         print(f"📁 创建输出目录: {output_dir}")
+    except FileExistsError:
+        pass
     return output_dir
 
 
@@ -119,18 +130,14 @@ def prepare_dataframe(data_list: List[Dict]) -> pd.DataFrame:
         print("⚠️ 警告: 数据列表为空")
         return pd.DataFrame(columns=EXCEL_COLUMNS)
     
-    # 创建 DataFrame
-    df = pd.DataFrame(data_list)
+    # 一次遍历按列收集数据（缺失字段补空），直接以列字典构建 DataFrame
+    # 避免先按行构建再补列、重排列带来的额外拷贝
+    columns = {col: [] for col in EXCEL_COLUMNS}
+    for row in data_list:
+        for col, values in columns.items():
+            values.append(row.get(col, ""))
     
-    # 补全缺失的列
-    for col in EXCEL_COLUMNS:
-        if col not in df.columns:
-            df[col] = ""
-    
-    # 按照指定顺序排列列
-    df = df[EXCEL_COLUMNS]
-    
-    return df
+    return pd.DataFrame(columns, columns=EXCEL_COLUMNS, copy=False)
 
 
 def save_excel(
@@ -186,7 +193,16 @@ def save_excel(
     
     try:
         # 尝试保存为 Excel
-        df.to_excel(filepath, index=False, engine='openpyxl')
+        if XLSXWRITER_AVAILABLE:
+            # 关闭 URL 自动转换：链接按普通字符串写入（与 openpyxl 行为一致，且不受超链接数量上限影响）
+            with pd.ExcelWriter(
+                filepath,
+                engine='xlsxwriter',
+                engine_kwargs={'options': {'strings_to_urls': False}}
+            ) as writer:
+                df.to_excel(writer, index=False)
+        else:
+            df.to_excel(filepath, index=False, engine='openpyxl')
         
         print("=" * 50)
         print(f"✅ 成功导出 Excel 文件！")
@@ -251,17 +267,18 @@ def save_csv(
     # 构建完整路径
     filepath = os.path.join(output_dir, filename)
     
-    # 准备数据
-    df = prepare_dataframe(data_list)
-    
     try:
-        # 保存为 CSV（使用 utf-8-sig 编码以支持 Excel 直接打开中文）
-        df.to_csv(filepath, index=False, encoding="utf-8-sig")
+        # 直接流式写入 CSV，无需构建 DataFrame（使用 utf-8-sig 编码以支持 Excel 直接打开中文）
+        # 缺失的列由 restval 补空，多余的字段忽略
+        with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.DictWriter(f, fieldnames=EXCEL_COLUMNS, restval="", extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(data_list)
         
         print("=" * 50)
         print(f"✅ 成功导出 CSV 文件！")
         print(f"📂 文件路径: {filepath}")
-        print(f"📊 包含数据: {len(df)} 行")
+        print(f"📊 包含数据: {len(data_list)} 行")
         print("=" * 50)
         
         return filepath
@@ -328,25 +345,35 @@ def _preview_with_rich(df: pd.DataFrame, total_rows: int, preview_rows: int) ->
     for col_name, width in display_columns:
         table.add_column(col_name, width=width, overflow="ellipsis")
     
-    # 添加数据行
-    for idx, row in df.iterrows():
+    # 添加数据行（itertuples 返回普通元组，比 iterrows 逐行构造 Series 快得多）
+    # 元组第 0 位是行索引，列位置需要整体后移一位
+    col_idx = {col: i + 1 for i, col in enumerate(df.columns)}
+    official_pos = col_idx["项目官网链接"]
+    apply_pos = col_idx["申请链接"]
+    name_pos = col_idx["项目名称"]
+    deadline_pos = col_idx["项目deadline"]
+    escape = rich_escape
+    
+    for row in df.itertuples(index=True, name=None):
+        idx = row[0]
+        
         # 处理链接列 - 使用 Text 对象创建可点击链接（避免 markup 解析错误）
-        official_link = str(row.get("项目官网链接", "N/A"))
-        apply_link = str(row.get("申请链接", "N/A"))
+        official_link = str(row[official_pos])
+        apply_link = str(row[apply_pos])
         
         # 创建可点击链接（使用 Text 对象，更安全）
         official_display = _create_clickable_link(official_link, "🔗 点击查看")
         apply_display = _create_clickable_link(apply_link, "🔗 申请")
         
         # 项目名称截断并转义
-        prog_name_raw = str(row.get("项目名称", ""))
+        prog_name_raw = str(row[name_pos])
         prog_name = prog_name_raw[:28]
         if len(prog_name_raw) > 28:
             prog_name += "..."
-        prog_name = rich_escape(prog_name)  # 转义特殊字符
+        prog_name = escape(prog_name)  # 转义特殊字符
         
         # deadline 也需要转义
-        deadline = rich_escape(str(row.get("项目deadline", "N/A"))[:20])
+        deadline = escape(str(row[deadline_pos])[:20])
         
         table.add_row(
             str(idx + 1),
@@ -356,20 +383,15 @@ def _preview_with_rich(df: pd.DataFrame, total_rows: int, preview_rows: int) ->
             deadline
         )
     
-    # 打印表格
-    console.print()
-    console.print(table)
-    console.print()
-    
-    # 打印提示
-    console.print(
-        Panel(
-            "💡 [bold green]提示[/bold green]: 点击 [cyan]🔗 点击查看[/cyan]、[cyan]🔗 注册[/cyan] 或 [cyan]🔗 登录[/cyan] 可在浏览器中打开链接验证爬取结果",
-            title="链接验证",
-            border_style="green"
-        )
+    # 提示
+    hint = Panel(
+        "💡 [bold green]提示[/bold green]: 点击 [cyan]🔗 点击查看[/cyan]、[cyan]🔗 注册[/cyan] 或 [cyan]🔗 登录[/cyan] 可在浏览器中打开链接验证爬取结果",
+        title="链接验证",
+        border_style="green"
     )
-    console.print()
+    
+    # 表格与提示合并为一次输出（每次 print 都会刷新一次终端）
+    console.print(Group(Text(), table, Text(), hint, Text()))
 
 
 def preview_full_data(data_list: List[Dict]) -> None:
@@ -386,6 +408,11 @@ def preview_full_data(data_list: List[Dict]) -> None:
     df = prepare_dataframe(data_list)
     
     if RICH_AVAILABLE and console:
+        # 非交互环境（输出被重定向）无法翻页，一次性输出全部行
+        if not sys.stdout.isatty():
+            _preview_with_rich(df, len(df), len(df))
+            return
+        
         # 显示完整表格（每 20 行分页）
         page_size = 20
         total_pages = (len(df) + page_size - 1) // page_size
@@ -2,8 +2,48 @@
 数据去重工具
 用于移除爬取结果中的重复项目
 """
-from typing import List, Dict, Set
-from collections import OrderedDict
+import re
+from typing import List, Dict
+
+
+# 默认去重字段
+DEFAULT_KEY_FIELDS = ["项目名称", "项目链接"]
+
+# 连续空白符（用于名称标准化）
+_WS_RE = re.compile(r"\s+")
+
+
+def _fast_key(item: Dict) -> tuple:
+    """
+    默认策略（名称 + 链接）的唯一键构建，省去逐字段的分支判断
+    """
+    name = _WS_RE.sub(" ", item.get("项目名称", "").strip())
+    url = item.get("项目链接", "").strip()
+    return (name, url)
+
+
+def _build_key(item: Dict, key_fields: List[str]) -> tuple:
+    """
+    按指定字段构建唯一键（通用策略）
+    """
+    key_values = []
+    for field in key_fields:
+        value = item.get(field, "")
+        
+        # 智能标准化
+        if field == "项目链接":
+            # URL: 去除首尾空格，但保留大小写（hash 区分大小写）
+            value = value.strip()
+        elif field == "项目名称":
+            # 名称: 去除首尾空格，统一内部空白符
+            value = _WS_RE.sub(" ", value.strip())
+        else:
+            # 其他字段: 基础清理
+            value = value.strip()
+        
+        key_values.append(value)
+    
+    return tuple(key_values)
 
 
 def deduplicate_results(results: List[Dict], key_fields: List[str] = None) -> List[Dict]:
@@ -27,44 +67,26 @@ def deduplicate_results(results: List[Dict], key_fields: List[str] = None) -> Li
     
     # 默认使用 名称+链接 组合（最精确）
     if key_fields is None:
-        key_fields = ["项目名称", "项目链接"]
+        key_fields = DEFAULT_KEY_FIELDS
     
-    seen_keys: Set[tuple] = set()
-    unique_results = []
-    duplicate_count = 0
+    # dict 保持插入顺序，一次 setdefault 同时完成判重和保序
+    seen: Dict[tuple, Dict] = {}
+    use_fast_key = key_fields == DEFAULT_KEY_FIELDS
     
     for item in results:
-        # 构建唯一键
-        key_values = []
-        for field in key_fields:
-            value = item.get(field, "")
-            
-            # 智能标准化
-            if field == "项目链接":
-                # URL: 去除首尾空格，但保留大小写（hash 区分大小写）
-                value = value.strip()
-            elif field == "项目名称":
-                # 名称: 去除首尾空格，统一内部空白符
-                value = " ".join(value.split())
-            else:
-                # 其他字段: 基础清理
-                value = value.strip()
-            
-            key_values.append(value)
-        
-        unique_key = tuple(key_values)
-        
-        # 检查是否已存在
-        if unique_key not in seen_keys:
-            seen_keys.add(unique_key)
-            unique_results.append(item)
+        if use_fast_key:
+            unique_key = _fast_key(item)
         else:
-            duplicate_count += 1
+            unique_key = _build_key(item, key_fields)
+        
+        # 仅保留首次出现的记录
+        seen.setdefault(unique_key, item)
     
+    duplicate_count = len(results) - len(seen)
     if duplicate_count > 0:
-        print(f"🔧 数据去重: 移除了 {duplicate_count} 条重复记录，保留 {len(unique_results)} 条唯一记录")
+        print(f"🔧 数据去重: 移除了 {duplicate_count} 条重复记录，保留 {len(seen)} 条唯一记录")
     
-    return unique_results
+    return list(seen.values())
 
 
 def deduplicate_by_name(results: List[Dict]) -> List[Dict]:
@@ -1,9 +1,65 @@
 # -*- coding: utf-8 -*-
 import requests
 import re
-from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
-from typing import Dict, Optional, List, Set
+import time
+import threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit
+from functools import lru_cache
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, Future
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import Dict, Optional, List, Set, Tuple, Callable, Iterator
+
+# 尝试导入 pyahocorasick（多关键词单遍匹配），未安装时回退到逐个子串查找
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# HTML 解析器：优先使用 lxml（C 实现，比纯 Python 的 html.parser 快一个数量级）
+try:
+    import lxml
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+# deadline 所在标题的匹配正则（模块级编译一次）
+_DEADLINE_HDR_RE = re.compile(r'Deadline|Date', re.IGNORECASE)
+
+# 只解析链接标签（deadline 已找到后，后续页面只需要链接，不必构建完整 DOM）
+_ANCHOR_STRAINER = SoupStrainer('a')
+
+# 页面头部 <meta> 声明的字符集（只在响应头未声明 charset 时使用）
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+
+
+class _HostBusy(Exception):
+    """
+    预取请求因站点并发名额已满而放弃（遍历到该链接时再正常请求）
+    """
+
+
+def _build_matcher(keywords: List[str]) -> Callable[[str], bool]:
+    """
+    将关键词列表编译为单遍匹配函数：判断文本（已小写）是否包含任一关键词
+    
+    优先使用 Aho-Corasick 自动机，未安装 pyahocorasick 时使用合并后的正则（同样在 C 层一次扫描）
+    """
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for kw in keywords:
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    
+    pattern = re.compile('|'.join(re.escape(kw) for kw in keywords))
+    return lambda text: pattern.search(text) is not None
+
 
 class DeepCrawler:
     """
@@ -23,47 +79,246 @@ class DeepCrawler:
         "application portal", "login", "register", "apply"
     ]
     
+    # 申请入口页面应包含的登录相关术语
+    LOGIN_KEYWORDS = [
+        "log in", "login", "sign in", "create an account", 
+        "start your application", "application portal"
+    ]
+    
+    # 单站点访问限制（所有实例共享计数：爬虫通常在多个线程里为每个项目各建一个 DeepCrawler，
+    # 它们访问的是同一所学校的网站，需要合并限流，避免触发 429/503）
+    HOST_MAX_CONCURRENCY = 2    # 同一站点同时进行的请求数（预取与正常请求共用）
+    HOST_MIN_INTERVAL = 0.2     # 同一站点相邻请求的最小间隔（秒）
+    # 站点 -> [进行中的请求数, 下一个可发送时间点]
+    _host_state: Dict[str, List[float]] = {}
+    _host_cond = threading.Condition()
+    
+    # 关键词匹配函数（类加载时编译一次，所有实例共享）
+    _match_follow = staticmethod(_build_matcher(KEYWORDS_FOLLOW))
+    _match_apply = staticmethod(_build_matcher(KEYWORDS_APPLY))
+    _match_login = staticmethod(_build_matcher(LOGIN_KEYWORDS))
+    
+    # 校验申请入口时最多读取的字节数（登录提示总在页面开头部分）
+    VALIDATE_READ_BYTES = 64 * 1024
+    
+    # 申请入口校验结果缓存（所有实例共享：各项目页面往往链接到同一个申请系统，
+    # 而爬虫通常为每个项目新建一个 DeepCrawler），超过上限时淘汰最早的记录
+    VALIDATE_CACHE_MAX = 4096
+    _validate_cache: Dict[str, bool] = {}
+    _validate_cache_lock = threading.Lock()
+    
+    # 参与日期提取缓存的最大文本长度（更长的文本直接计算，避免缓存占用过多内存）
+    DATE_CACHE_MAX_TEXT = 4096
+    
+    # 单个页面最多解析的字节数
+    MAX_PAGE_BYTES = 2 * 1024 * 1024
+    
+    # 非网页资源（宣传册、压缩包、图片等）不跟进
+    SKIP_EXTENSIONS = ('.pdf', '.zip', '.doc', '.docx', '.jpg', '.jpeg', '.png', '.gif')
+    
     # 增强的日期正则
     # 匹配: Jan 15, 2026 | January 15 | 15 Jan 2026 | 2026-01-15
-    DATE_PATTERNS = [
-        re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2}(?:st|nd|rd|th)?,?\s+(?:20\d{2})?', re.IGNORECASE),
-        re.compile(r'\d{1,2}(?:st|nd|rd|th)?\s+(?:of\s+)?(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?,?\s+(?:20\d{2})?', re.IGNORECASE),
-        re.compile(r'20\d{2}-\d{2}-\d{2}'), # ISO format
+    # 按优先级排列：同一行内多种格式都出现时，取排在前面的格式
+    _MONTH = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?'
+    _DATE_SOURCES = [
+        _MONTH + r'\s+\d{1,2}(?:st|nd|rd|th)?,?\s+(?:20\d{2})?',
+        r'\d{1,2}(?:st|nd|rd|th)?\s+(?:of\s+)?' + _MONTH + r',?\s+(?:20\d{2})?',
+        r'20\d{2}-\d{2}-\d{2}',  # ISO format
     ]
+    DATE_PATTERNS = [re.compile(src, re.IGNORECASE) for src in _DATE_SOURCES]
+    # 三种格式合并的正则：一次扫描找出含日期的行，其余行不再逐个格式尝试
+    # 空白只匹配行内空白（[^\S\n]），不会跨行匹配
+    DATE_PATTERN = re.compile(
+        '|'.join('(?:' + src.replace(r'\s', r'[^\S\n]') + ')' for src in _DATE_SOURCES),
+        re.IGNORECASE
+    )
 
-    def __init__(self, max_depth: int = 3, timeout: int = 10):
+    def __init__(self, max_depth: int = 3, timeout: int = 10, fetch_workers: int = 4):
         self.max_depth = max_depth
         self.timeout = timeout
+        self.fetch_workers = fetch_workers  # 同层链接并发预取的线程数
         self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
         }
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        
+        # 扩大连接池：预取线程与校验请求同时访问同一站点时复用已建立的 TCP/TLS 连接
+        # 服务端偶发 5xx 时快速重试一次
+        adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=64,
+            pool_block=False,
+            max_retries=Retry(total=1, backoff_factor=0.2, status_forcelist=(500, 502, 503, 504))
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @contextmanager
+    def _polite_get(self, url: str, speculative: bool = False, **kwargs) -> Iterator[requests.Response]:
+        """
+        按站点限流发送 GET 请求（所有实例共享限流状态），用作上下文管理器，退出时关闭响应
+        
+        每个站点最多 HOST_MAX_CONCURRENCY 个并发请求（流式读取响应体期间也占用名额），
+        且请求之间按 HOST_MIN_INTERVAL 错开；
+        speculative=True（预取）的请求不排队：至少要留出一个名额给正常请求，否则抛出 _HostBusy 放弃
+        """
+        host = urlparse(url).netloc
+        cond = self._host_cond
+        with cond:
+            state = self._host_state.setdefault(host, [0, 0.0])
+            if speculative:
+                if state[0] >= self.HOST_MAX_CONCURRENCY - 1:
+                    raise _HostBusy(host)
+            else:
+                while state[0] >= self.HOST_MAX_CONCURRENCY:
+                    cond.wait()
+            state[0] += 1
+            # 预约下一个发送时间点，多个线程依次错开
+            now = time.monotonic()
+            slot = max(now, state[1])
+            state[1] = slot + self.HOST_MIN_INTERVAL
+        
+        try:
+            delay = slot - now
+            if delay > 0:
+                time.sleep(delay)
+            with self.session.get(url, timeout=self.timeout, **kwargs) as resp:
+                yield resp
+        finally:
+            with cond:
+                state[0] -= 1
+                cond.notify()
+
+    def _get_page(
+        self,
+        url: str,
+        anchors_only: bool = False,
+        speculative: bool = False,
+        pages: Optional[Dict[str, Optional[Tuple[str, bytes]]]] = None
+    ) -> Optional[Tuple[BeautifulSoup, bytes]]:
+        """
+        下载并解析页面，返回 (soup, 原始 HTML 字节)；原始字节用于申请页校验
+        
+        anchors_only=True 时只解析 <a> 标签，解析更快、占用内存更少，
+        但得到的 soup 不包含正文，不能用于 deadline 提取；
+        speculative=True 表示预取请求，站点名额已满时抛出 _HostBusy；
+        pages 为本次遍历已下载页面的缓存（规范化 URL -> (content-type, 原始字节)，下载失败为 None），
+        命中时不再请求，下载结果也写入其中
+        """
+        key = self._canon(url)
+        if pages is not None and key in pages:
+            raw = pages[key]
+        else:
+            raw = self._fetch_page(url, speculative)
+            if pages is not None:
+                pages[key] = raw
+        if raw is None:
+            return None
+        ctype, content = raw
+        try:
+            # 显式指定编码，避免 BS4 对未声明编码的页面逐字节探测
+            encoding = self._detect_encoding(ctype, content)
+            if anchors_only:
+                return BeautifulSoup(content, HTML_PARSER, parse_only=_ANCHOR_STRAINER, from_encoding=encoding), content
+            return BeautifulSoup(content, HTML_PARSER, from_encoding=encoding), content
+        except:
+            pass
+        return None
 
-    def _get_soup(self, url: str) -> Optional[BeautifulSoup]:
+    def _fetch_page(self, url: str, speculative: bool = False) -> Optional[Tuple[str, bytes]]:
+        """
+        下载页面，返回 (content-type, 原始 HTML 字节)；非 200 或非 HTML 时返回 None
+        """
         try:
-            resp = self.session.get(url, timeout=self.timeout)
-            if resp.status_code == 200:
-                return BeautifulSoup(resp.content, 'html.parser')
+            # 流式请求：先看响应头，非 HTML 内容（PDF、图片等）不下载也不解析
+            with self._polite_get(url, speculative=speculative, stream=True) as resp:
+                if resp.status_code != 200:
+                    return None
+                ctype = resp.headers.get('content-type', '').lower()
+                if ctype and 'html' not in ctype and 'xml' not in ctype:
+                    return None
+                return ctype, resp.raw.read(self.MAX_PAGE_BYTES, decode_content=True)
+        except _HostBusy:
+            raise
         except:
             pass
         return None
 
+    @staticmethod
+    def _detect_encoding(ctype: str, content: bytes) -> str:
+        """
+        确定页面编码：响应头 charset > 页面头部 <meta> 声明 > utf-8
+        
+        不使用 resp.encoding：requests 对未声明 charset 的 text/html 默认返回 ISO-8859-1
+        """
+        for param in ctype.split(';')[1:]:
+            key, _, value = param.partition('=')
+            if key.strip() == 'charset' and value.strip(' "\''):
+                return value.strip(' "\'')
+        match = _META_CHARSET_RE.search(content, 0, 2048)
+        if match:
+            return match.group(1).decode('ascii')
+        return 'utf-8'
+
+    @staticmethod
+    def _anchor_text(a) -> str:
+        """
+        获取链接文本（小写）；只有单个文本子节点时直接取 .string，跳过 get_text 的树遍历
+        """
+        string = a.string
+        if string is not None:
+            return string.strip().lower()
+        return a.get_text(" ", strip=True).lower()
+
     def _extract_date(self, text: str) -> Optional[str]:
         if not text:
             return None
+        # 模板化的 deadline 区块常在同一站点多个页面重复出现，短文本走缓存
+        if len(text) <= self.DATE_CACHE_MAX_TEXT:
+            return self._find_date(text)
+        return self._find_date.__wrapped__(text)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _find_date(text: str) -> Optional[str]:
         # 限定查找范围，避免匹配到 irrelevant dates (like "Copyright 2025")
         # 优先查找 "Deadline", "Dates" 附近的文本
-        lines = text.split('\n')
-        for line in lines:
-            if len(line) > 200: continue # Skip long blocks
-            for pattern in self.DATE_PATTERNS:
-                match = pattern.search(line)
-                if match:
+        last_line_start = -1
+        for match in DeepCrawler.DATE_PATTERN.finditer(text):
+            line_start = text.rfind('\n', 0, match.start()) + 1
+            if line_start == last_line_start:
+                continue  # 同一行已经检查过
+            last_line_start = line_start
+            line_end = text.find('\n', match.end())
+            if line_end == -1:
+                line_end = len(text)
+            # 所在行过长视为大段正文，跳过 (Skip long blocks)
+            if line_end - line_start > 200:
+                continue
+            # 行内按格式优先级取第一个匹配
+            line = text[line_start:line_end]
+            for pattern in DeepCrawler.DATE_PATTERNS:
+                found = pattern.search(line)
+                if found:
                     # 简单的有效性检查 (比如排除单纯的 "May 2025" 如果我们需要具体日期，或者接受它)
-                    return match.group(0)
+                    return found.group(0)
         return None
 
+    @staticmethod
+    def _canon(url: str) -> str:
+        """
+        URL 规范化（用作去重键）：忽略锚点、跟踪参数、参数顺序、末尾斜杠和协议/域名大小写
+        """
+        parts = urlsplit(url)
+        query = '&'.join(sorted(
+            kv for kv in parts.query.split('&')
+            if kv and not kv.startswith(('utm_', 'fbclid', 'gclid'))
+        ))
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), query, ''))
+
     def crawl(self, start_url: str) -> Dict[str, str]:
         """
         开始深度遍历
@@ -75,95 +330,237 @@ class DeepCrawler:
         visited = set()
         result = {"deadline": None, "apply_link": None}
         
-        self._dfs(start_url, 0, visited, result)
+        # 同层候选链接交给线程池并发下载，DFS 访问到时直接取结果（以规范化 URL 为键）
+        executor = ThreadPoolExecutor(max_workers=self.fetch_workers)
+        # 值为 (future, 是否只解析了链接)
+        prefetched: Dict[str, Tuple[Future, bool]] = {}
+        # 本次遍历已下载的页面（遍历、预取和申请页校验共用），同一 URL 只下载一次
+        pages: Dict[str, Optional[Tuple[str, bytes]]] = {}
+        try:
+            self._walk(start_url, visited, result, executor, prefetched, pages)
+        finally:
+            # 已拿到结果（或遍历结束），取消尚未开始的预取，不等待进行中的请求
+            for future, _ in prefetched.values():
+                future.cancel()
+            executor.shutdown(wait=False)
         
         return {
             "deadline": result["deadline"] if result["deadline"] else "N/A",
             "apply_link": result["apply_link"] if result["apply_link"] else "N/A"
         }
 
-    def _dfs(self, url: str, depth: int, visited: Set[str], result: Dict):
+    def _walk(
+        self,
+        start_url: str,
+        visited: Set[str],
+        result: Dict,
+        executor: ThreadPoolExecutor,
+        prefetched: Dict[str, Tuple[Future, bool]],
+        pages: Dict[str, Optional[Tuple[str, bytes]]]
+    ):
         """
         深度优先遍历核心逻辑
+        
+        使用显式栈代替递归；每处理完一个页面就检查是否已找到全部信息，找到即停止
         """
-        # 终止条件
-        if depth >= self.max_depth:
-            return
-        if result["deadline"] and result["apply_link"]:
-            return
-        if url in visited:
-            return
+        stack: List[Tuple[str, int]] = [(start_url, 0)]
+        while stack and not (result["deadline"] and result["apply_link"]):
+            url, depth = stack.pop()
             
-        visited.add(url)
-        # print(f"  [Depth {depth}] Visiting: {url}") # Debug
+            # 终止条件
+            if depth >= self.max_depth:
+                continue
+            key = self._canon(url)
+            if key in visited:
+                continue
+            
+            visited.add(key)
+            # print(f"  [Depth {depth}] Visiting: {url}") # Debug
 
-        soup = self._get_soup(url)
-        if not soup:
-            return
+            # deadline 已找到时，页面只用于找链接
+            anchors_only = bool(result["deadline"])
+            entry = prefetched.pop(key, None)
+            page = None
+            if entry:
+                try:
+                    if not entry[1] or anchors_only:
+                        page = entry[0].result()
+                    elif not entry[0].cancel():
+                        # 预取时只解析了链接：等已开始的下载完成，下面用缓存的字节完整解析
+                        entry[0].result()
+                except _HostBusy:
+                    pass  # 预取因站点名额已满被放弃，下面正常请求
+            if page is None:
+                page = self._get_page(url, anchors_only, pages=pages)
+            if not page:
+                continue
+            soup = page[0]
 
-        # 1. 提取信息 (Deadline & Apply Link)
-        self._extract_info_from_page(soup, url, result)
-        
-        if result["deadline"] and result["apply_link"]:
-            return
+            # 一次遍历得到 Apply 候选链接和下一步链接 (Keyword Trigger)
+            apply_candidates, follow_links = self._scan_anchors(soup, url)
 
-        # 2. 寻找下一步链接 (Keyword Trigger)
-        if depth < self.max_depth - 1:
-            next_links = self._get_next_links(soup, url)
-            for link in next_links:
-                if result["deadline"] and result["apply_link"]:
-                    break
-                self._dfs(link, depth + 1, visited, result)
+            # 1. 提取信息 (Deadline & Apply Link)
+            self._extract_info_from_page(soup, result, apply_candidates, prefetched, pages)
+            
+            if result["deadline"] and result["apply_link"]:
+                break
+            if result["apply_link"]:
+                # 申请入口已校验过，之前入栈的同一链接不再访问
+                visited.add(self._canon(result["apply_link"]))
 
-    def _validate_page_content(self, url: str) -> bool:
+            # 2. 跟进下一步链接
+            if depth < self.max_depth - 1:
+                next_links = self._rank_links(follow_links, result["apply_link"])
+                # 并发预取所有候选链接，把逐个等待的网络往返重叠起来
+                anchors_only = bool(result["deadline"])
+                for link in next_links:
+                    link_key = self._canon(link)
+                    if link_key not in visited and link_key not in prefetched:
+                        prefetched[link_key] = (
+                            executor.submit(self._get_page, link, anchors_only, True, pages), anchors_only
+                        )
+                
+                # 逆序入栈，保证排在最前（最相关）的链接最先访问
+                stack.extend((link, depth + 1) for link in reversed(next_links))
+
+    def _validate_page_content(
+        self,
+        url: str,
+        pages: Optional[Dict[str, Optional[Tuple[str, bytes]]]] = None
+    ) -> bool:
         """
         验证页面是否包含 'log in' 或 'create an account'
+        
+        检查原始 HTML（含属性和脚本），而不只是可见文本；
+        结果按 URL 缓存；页面已在本次遍历中下载过（pages）时直接检查，不再重复请求，
+        校验时读到了完整页面也写入 pages 供遍历复用
         """
         if not url or "how-to-apply" in url or "application-process" in url: 
             return False # URL pattern check: explicit instruction to not stop at 'how-to-apply'
+        
+        cached = self._validate_cache.get(url)
+        if cached is not None:
+            return cached
             
+        key = self._canon(url)
         try:
-            resp = self.session.get(url, timeout=self.timeout)
-            text = resp.text.lower()
+            raw = pages.get(key) if pages else None
+            if raw is not None:
+                # 与流式读取保持一致：只检查开头 VALIDATE_READ_BYTES 字节
+                text = raw[1][:self.VALIDATE_READ_BYTES].decode('utf-8', 'ignore').lower()
+            else:
+                # 流式读取：非 HTML 直接放弃，HTML 只读开头部分，不下载整页
+                with self._polite_get(url, stream=True) as resp:
+                    ctype = resp.headers.get('content-type', '').lower()
+                    if 'html' not in ctype:
+                        text = ""
+                    else:
+                        head = resp.raw.read(self.VALIDATE_READ_BYTES, decode_content=True)
+                        text = head.decode('utf-8', 'ignore').lower()
+                        # 读到的内容不足上限说明已是完整页面，遍历到该链接时可直接使用
+                        if pages is not None and resp.status_code == 200 and len(head) < self.VALIDATE_READ_BYTES:
+                            pages[key] = (ctype, head)
             # 宽松匹配，确保包含登录相关术语
-            return any(kw in text for kw in ["log in", "login", "sign in", "create an account", "start your application", "application portal"])
+            valid = self._match_login(text)
         except:
             return False
+        
+        cache = self._validate_cache
+        with self._validate_cache_lock:
+            if len(cache) >= self.VALIDATE_CACHE_MAX:
+                cache.pop(next(iter(cache)))
+            cache[url] = valid
+        return valid
+
+    def _scan_anchors(self, soup: BeautifulSoup, base_url: str) -> Tuple[List[str], Dict[str, Tuple[int, str]]]:
+        """
+        单次遍历页面所有链接，同时收集 Apply 候选链接和下一步跟进链接
+        
+        每个链接的文本和完整 URL 只计算一次
+        
+        返回:
+            (apply_candidates, follow_links)；follow_links 为 规范化 URL -> (是否命中 Apply 关键词, 原始 URL)，
+            按页面顺序排列，交给 _rank_links 排序
+        """
+        apply_candidates: List[str] = []
+        follow_links: Dict[str, Tuple[int, str]] = {}  # 规范化 URL -> (是否命中 Apply 关键词, 原始 URL)（去重并保序）
+        
+        for a in soup.find_all('a', href=True):
+            href = a['href']
+            
+            # 排除无效链接（先做廉价的 href 前缀判断，再拼接 URL、提取文本）
+            if not href or href[:1] == '#' or href.startswith(('javascript', 'mailto:', 'tel:')):
+                continue
+            
+            text = self._anchor_text(a)
+            is_apply_keyword = self._match_apply(text)
+            is_follow_keyword = self._match_follow(text)
+            if not (is_apply_keyword or is_follow_keyword):
+                continue
+            
+            full_url = urljoin(base_url, href)
+            if urlsplit(full_url).path.lower().endswith(self.SKIP_EXTENSIONS):
+                continue
+            # 简单的域限制 (可选)
+            # if "nyu.edu" not in full_url: continue 
+            
+            if is_follow_keyword:
+                follow_links.setdefault(self._canon(full_url), (int(is_apply_keyword), full_url))
+            
+            if is_apply_keyword:
+                if not full_url.startswith(('http', '/')) or 'pdf' in full_url:
+                    continue
+                # 关键逻辑：如果链接本身包含 "how-to-apply" 或 "/applying"，或者只是 "admissions" 首页
+                # 即使文本是 "Apply Now" (例如导航栏上的)，它可能只是跳到说明页
+                if "how-to-apply" in full_url or "/applying" in full_url or "/admissions" in full_url:
+                    # 这是一个路径，不是终点。DFS 会通过跟进链接自动处理它（前提是 text 也在 KEYWORDS_FOLLOW 中）
+                    continue
+                apply_candidates.append(full_url)
+        
+        return apply_candidates, follow_links
+
+    def _rank_links(self, follow_links: Dict[str, Tuple[int, str]], apply_link: Optional[str]) -> List[str]:
+        """
+        选出下一步要跟进的链接
+        
+        还没找到申请入口时，文本同时命中 Apply 关键词的链接更可能通向申请入口，优先跟进；
+        已找到时不再提前这些链接，并跳过申请入口本身（它已校验过，无需再访问）。
+        同分保持页面顺序，每个页面最多跟进 5 个链接，避免广度过大
+        """
+        if apply_link:
+            apply_key = self._canon(apply_link)
+            return [link for key, (_, link) in follow_links.items() if key != apply_key][:5]
+        ranked = sorted(follow_links.values(), key=lambda item: item[0], reverse=True)
+        return [link for _, link in ranked[:5]]
 
-    def _extract_info_from_page(self, soup: BeautifulSoup, base_url: str, result: Dict):
+    def _extract_info_from_page(
+        self,
+        soup: BeautifulSoup,
+        result: Dict,
+        apply_candidates: List[str],
+        prefetched: Optional[Dict[str, Tuple[Future, bool]]] = None,
+        pages: Optional[Dict[str, Optional[Tuple[str, bytes]]]] = None
+    ):
         # 1. Apply Link
         if not result["apply_link"]:
-            # 遍历所有链接，检查文本和链接
-            for a in soup.find_all('a', href=True):
-                text = a.get_text(" ", strip=True).lower()
-                href = a.get('href')
-                full_url = urljoin(base_url, href)
-                
-                # 排除无效链接
-                if not full_url.startswith(('http', '/')) or 'pdf' in full_url: continue
-                if full_url.startswith(('mailto:', 'tel:')): continue
-
-                # 检查是否是 Apply 关键词触发
-                is_apply_keyword = any(kw in text for kw in self.KEYWORDS_APPLY)
-                
-                if is_apply_keyword:
-                    # 关键逻辑：如果链接本身包含 "how-to-apply" 或 "/applying"，或者只是 "admissions" 首页
-                    # 即使文本是 "Apply Now" (例如导航栏上的)，它可能只是跳到说明页
-                    if "how-to-apply" in full_url or "/applying" in full_url or "/admissions" in full_url:
-                         # 这是一个路径，不是终点。DFS 会通过 _get_next_links 自动处理它（前提是 text 也在 KEYWORDS_FOLLOW 中）
-                         # 为了保险，我们可以强制确保它被加入 visited/queue，但当前架构下依靠 DFS 自然发现即可
-                         continue
-
-                    # 验证目标页面内容 (必须包含 log in / create account)
-                    if self._validate_page_content(full_url):
-                        result["apply_link"] = full_url
-                        break
+            for full_url in apply_candidates:
+                # 验证目标页面内容 (必须包含 log in / create account)
+                # 该链接正在预取时等它下载完成，校验直接使用已下载的页面，避免重复请求
+                entry = prefetched.get(self._canon(full_url)) if prefetched else None
+                if entry:
+                    try:
+                        entry[0].result()
+                    except _HostBusy:
+                        pass
+                if self._validate_page_content(full_url, pages):
+                    result["apply_link"] = full_url
+                    break
         
         # 2. Deadline
         if not result["deadline"]:
             # 策略A: 查找含有 "Deadline" 的标题下的文本
             deadline_text = ""
-            headers = soup.find_all(['h1', 'h2', 'h3', 'h4', 'th', 'strong', 'b'], string=re.compile(r'Deadline|Date', re.IGNORECASE))
+            headers = soup.find_all(['h1', 'h2', 'h3', 'h4', 'th', 'strong', 'b'], string=_DEADLINE_HDR_RE)
             for h in headers:
                 # 检查父容器文本或兄弟节点
                 parent = h.find_parent()
@@ -177,28 +574,3 @@ class DeepCrawler:
             extracted = self._extract_date(deadline_text)
             if extracted:
                 result["deadline"] = extracted
-
-    def _get_next_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
-        links = []
-        # 只提取相关链接
-        candidates = soup.find_all('a', href=True)
-        for a in candidates:
-            text = a.get_text(strip=True).lower()
-            href = a.get('href')
-            
-            # 过滤无效链接
-            if not href or href.startswith(('#', 'javascript', 'mailto', 'tel')):
-                continue
-                
-            full_url = urljoin(base_url, href)
-            # 简单的域限制 (可选)
-            # if "nyu.edu" not in full_url: continue 
-            
-            # 关键词匹配
-            for kw in self.KEYWORDS_FOLLOW:
-                if kw in text:
-                    links.append(full_url)
-                    break 
-        
-        # 去重并限制数量 (避免广度过大)
-        return list(dict.fromkeys(links))[:5] # 每个页面最多跟进5个最相关的链接
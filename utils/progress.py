@@ -5,11 +5,13 @@
 """
 
 import sys
+import math
 import time
 import signal
+import itertools
 import threading
-from typing import List, Dict, Callable, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed, Future
+from typing import List, Dict, Callable, Any, Optional, Iterable, Iterator, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED, Future
 
 # 尝试导入 rich 库
 try:
@@ -56,17 +58,33 @@ class CrawlerProgress:
         ... )
     """
     
-    def __init__(self, max_workers: int = 8):
+    # 进度条刷新批量：每累计 N 个完成或间隔超过指定秒数才重绘一次
+    PROGRESS_BATCH = 8
+    PROGRESS_FLUSH_INTERVAL = 0.2
+    
+    def __init__(self, max_workers: int = 8, keep_durations: bool = False):
         """
         初始化进度管理器
         
         参数:
             max_workers (int): 并发线程数
+            keep_durations (bool): 是否保留每个任务的耗时明细（默认只维护汇总值）
         """
         self.max_workers = max_workers
+        self.keep_durations = keep_durations
         self.results: List[Dict] = []
         self.failed_items: List[Dict] = []  # 存储失败的项目
-        self.durations: List[float] = []
+        self.durations: List[float] = []  # 仅在 keep_durations=True 时记录
+        
+        # 耗时汇总（O(1) 更新）
+        self._dur_sum = 0.0
+        self._dur_min = math.inf
+        self._dur_max = 0.0
+        self._dur_n = 0
+        
+        # 进度条批量刷新状态
+        self._pending_advance = 0
+        self._last_flush = time.monotonic()
         self.is_interrupted = False  # 是否被中断
         self.lock = threading.Lock()
         
@@ -107,11 +125,78 @@ class CrawlerProgress:
         self.results = []
         self.failed_items = []
         self.durations = []
+        self._dur_sum = 0.0
+        self._dur_min = math.inf
+        self._dur_max = 0.0
+        self._dur_n = 0
+        self._pending_advance = 0
+        self._last_flush = time.monotonic()
         self.is_interrupted = False
         self.completed_count = 0
         self.success_count = 0
         self.fail_count = 0
     
+    def _flush_progress(self, progress: "Progress", task, force: bool = False) -> None:
+        """
+        批量推进进度条：累计 PROGRESS_BATCH 个完成或距上次刷新超过 PROGRESS_FLUSH_INTERVAL 秒时才更新
+        """
+        if not self._pending_advance:
+            return
+        now = time.monotonic()
+        if (force
+                or self._pending_advance >= self.PROGRESS_BATCH
+                or now - self._last_flush > self.PROGRESS_FLUSH_INTERVAL):
+            progress.update(
+                task,
+                advance=self._pending_advance,
+                success=self.success_count,
+                fail=self.fail_count
+            )
+            self._pending_advance = 0
+            self._last_flush = now
+    
+    def _record_duration(self, duration: float) -> None:
+        """记录一个成功任务的耗时（更新汇总值）"""
+        self._dur_sum += duration
+        self._dur_n += 1
+        if duration < self._dur_min:
+            self._dur_min = duration
+        if duration > self._dur_max:
+            self._dur_max = duration
+        if self.keep_durations:
+            self.durations.append(duration)
+    
+    def _iter_completed(
+        self,
+        executor: ThreadPoolExecutor,
+        items: Iterable[Dict],
+        task_func: Callable
+    ) -> Iterator[Tuple[Future, Dict]]:
+        """
+        按完成顺序产出 (future, item)
+        
+        任务按需提交，同一时刻最多保留 2×max_workers 个未完成任务，
+        避免一次性为所有项目创建 Future
+        """
+        it = iter(items)
+        pending: Dict[Future, Dict] = {
+            executor.submit(task_func, item): item
+            for item in itertools.islice(it, self.max_workers * 2)
+        }
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    # 先补充新任务，保持线程池满载
+                    for next_item in itertools.islice(it, 1):
+                        pending[executor.submit(task_func, next_item)] = next_item
+                    yield future, item
+        finally:
+            # 调用方提前退出（中断）时取消尚未开始的任务
+            for future in pending:
+                future.cancel()
+    
     def _run_with_rich_progress(
         self, 
         items: List[Dict], 
@@ -150,7 +235,8 @@ class CrawlerProgress:
                 TimeRemainingColumn(),
                 TextColumn("• [cyan]成功: {task.fields[success]}[/cyan] [red]失败: {task.fields[fail]}[/red]"),
                 console=console,
-                expand=False
+                expand=False,
+                refresh_per_second=5
             ) as progress:
                 
                 task = progress.add_task(
@@ -161,34 +247,20 @@ class CrawlerProgress:
                 )
                 
                 with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                    future_to_item = {
-                        executor.submit(task_func, item): item 
-                        for item in items
-                    }
-                    
-                    for future in as_completed(future_to_item):
+                    for future, item in self._iter_completed(executor, items, task_func):
                         if self.is_interrupted:
                             # 取消所有未完成的任务
-                            for f in future_to_item:
-                                f.cancel()
+                            executor.shutdown(wait=False, cancel_futures=True)
                             break
                         
-                        item = future_to_item[future]
                         try:
-                            data, duration = future.result(timeout=1)
+                            data, duration = future.result()
                             self.results.append(data)
                             
                             with self.lock:
                                 self.completed_count += 1
                                 self.success_count += 1
-                                self.durations.append(duration)
-                            
-                            progress.update(
-                                task, 
-                                advance=1,
-                                success=self.success_count,
-                                fail=self.fail_count
-                            )
+                                self._record_duration(duration)
                             
                         except Exception as exc:
                             with self.lock:
@@ -199,13 +271,12 @@ class CrawlerProgress:
                                     "link": item.get("link", ""),
                                     "error": str(exc)
                                 })
-                            
-                            progress.update(
-                                task, 
-                                advance=1,
-                                success=self.success_count,
-                                fail=self.fail_count
-                            )
+                        
+                        self._pending_advance += 1
+                        self._flush_progress(progress, task)
+                
+                # 刷新剩余的进度
+                self._flush_progress(progress, task, force=True)
         
         finally:
             # 恢复原始信号处理器
@@ -229,37 +300,29 @@ class CrawlerProgress:
         """
         print(f"\n🔥 [{phase_name}] 启动 {self.max_workers} 个并发窗口进行后台抓取...", flush=True)
         print(f"按 Ctrl+C 可随时中断", flush=True)
-        time.sleep(1)
         
         # 设置中断处理
         original_handler = signal.signal(signal.SIGINT, self._interrupt_handler)
         
         try:
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_item = {
-                    executor.submit(task_func, item): item 
-                    for item in items
-                }
-                
                 print(f"⏳ 任务队列已建立，正在全力运行中...", flush=True)
                 
-                for future in as_completed(future_to_item):
+                for future, item in self._iter_completed(executor, items, task_func):
                     if self.is_interrupted:
-                        for f in future_to_item:
-                            f.cancel()
+                        executor.shutdown(wait=False, cancel_futures=True)
                         break
                     
-                    item = future_to_item[future]
                     try:
-                        data, duration = future.result(timeout=1)
+                        data, duration = future.result()
                         self.results.append(data)
                         self.completed_count += 1
                         self.success_count += 1
-                        self.durations.append(duration)
+                        self._record_duration(duration)
                         
                         # 计算进度
                         percent = (self.completed_count / total) * 100
-                        avg_time = sum(self.durations) / len(self.durations)
+                        avg_time = self._dur_sum / self._dur_n
                         remaining = (total - self.completed_count) * avg_time / self.max_workers
                         
                         name_preview = data['项目名称'][:20] + "..." if len(data.get('项目名称', '')) > 20 else data.get('项目名称', '')
@@ -314,13 +377,13 @@ class CrawlerProgress:
             success_rate = (self.success_count / self.completed_count) * 100
             table.add_row("成功率", f"{success_rate:.1f}%")
         
-        if self.durations:
+        if self._dur_n:
             table.add_row("─" * 12, "─" * 15)
-            avg_duration = sum(self.durations) / len(self.durations)
+            avg_duration = self._dur_sum / self._dur_n
             table.add_row("平均耗时/任务", f"{avg_duration:.2f}s")
-            table.add_row("最快任务", f"{min(self.durations):.2f}s")
-            table.add_row("最慢任务", f"{max(self.durations):.2f}s")
-            table.add_row("累计抓取时间", f"{sum(self.durations):.1f}s")
+            table.add_row("最快任务", f"{self._dur_min:.2f}s")
+            table.add_row("最慢任务", f"{self._dur_max:.2f}s")
+            table.add_row("累计抓取时间", f"{self._dur_sum:.1f}s")
         
         console.print()
         console.print(Panel(table, title=status_title, border_style="yellow" if self.is_interrupted else "green"))
@@ -352,9 +415,9 @@ class CrawlerProgress:
         if self.completed_count > 0:
             print(f"  成功率: {(self.success_count/self.completed_count)*100:.1f}%", flush=True)
         
-        if self.durations:
-            avg = sum(self.durations) / len(self.durations)
-            print(f"  平均耗时: {avg:.2f}s | 最快: {min(self.durations):.2f}s | 最慢: {max(self.durations):.2f}s", flush=True)
+        if self._dur_n:
+            avg = self._dur_sum / self._dur_n
+            print(f"  平均耗时: {avg:.2f}s | 最快: {self._dur_min:.2f}s | 最慢: {self._dur_max:.2f}s", flush=True)
         
         if self.fail_count > 0:
             print(f"\n⚠️ 共有 {self.fail_count} 个项目抓取失败", flush=True)
@@ -4,19 +4,85 @@ Selenium 通用工具模块
 封装常用的 Selenium 操作，供所有爬虫复用
 """
 
+import os
 import time
+import random
+import logging
 import queue
 import threading
-from typing import Optional, List, Callable
+from collections import deque
+from dataclasses import dataclass, field
+import concurrent.futures
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Optional, List, Dict, Tuple, Union, Callable, Collection
 from contextlib import contextmanager
 
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, NoSuchWindowException, WebDriverException
+)
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 
-from utils.browser import get_driver, close_driver
+from utils.browser import get_driver, close_driver, _CLEAR_STORAGE_JS
+
+logger = logging.getLogger(__name__)
+
+
+# 浏览器已失效或与 chromedriver 通信失败时可能抛出的异常
+_DRIVER_ERRORS = (WebDriverException, Urllib3HTTPError, OSError)
+
+# get_many 的批量提取脚本：与 Selenium 一致，属性优先取 DOM property（如 href 为绝对地址）
+_GET_MANY_JS = """
+return arguments[0].map(function (l) {
+    var el = l.xpath
+        ? document.evaluate(l.xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(l.css);
+    if (!el) return null;
+    if (!l.attr) return (el.innerText || '').trim();
+    var v = el[l.attr];
+    if (v === undefined || v === null || typeof v === 'object' || typeof v === 'function') {
+        v = el.getAttribute(l.attr);
+    }
+    return v === null ? null : String(v);
+});
+"""
+
+# block_assets 拦截的静态资源（图片、字体、音视频），CSS/JS 不拦截
+_BLOCKED_ASSET_EXTENSIONS = (
+    "png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "bmp", "avif",
+    "woff", "woff2", "ttf", "otf", "eot",
+    "mp4", "webm", "mp3", "m4a", "ogg",
+)
+# 每个扩展名两条通配：不带参数的地址，以及带缓存参数的地址（如 logo.png?v=3）；
+# 不用 "*.png*"，以免误拦截 www.ttf.org 这类主机名中含扩展名的页面
+_BLOCKED_ASSET_PATTERNS = [
+    pattern
+    for ext in _BLOCKED_ASSET_EXTENSIONS
+    for pattern in ("*." + ext, "*." + ext + "?*")
+]
+
+# 页面可用判断：DOM 解析完成（interactive）即可，不等图片、iframe、统计脚本加载完（complete）；
+# 新窗口初始的 about:blank 也算加载完成，需要排除
+_PAGE_READY_JS = "return location.href !== 'about:blank' && document.readyState !== 'loading';"
+
+
+@dataclass
+class PooledDriver:
+    """
+    池中的浏览器实例及其使用统计（用于按使用次数/存活时间回收）
+    """
+    driver: WebDriver
+    uses: int = 0
+    created: float = field(default_factory=time.monotonic)
+    # 创建时池的代数，close_all 之后的旧实例据此丢弃，不再放回新池
+    generation: int = 0
+    # 本实例的最长存活时间（带随机抖动，避免同批创建的实例同时过期）
+    max_age: Optional[float] = None
+    # 本次借出期间是否调用过 driver.get()；未导航过的实例归还时无需清理
+    navigated: bool = False
 
 
 class BrowserPool:
@@ -32,130 +98,541 @@ class BrowserPool:
         >>> pool.close_all()
     """
     
-    def __init__(self, size: int = 8, headless: bool = True):
+    # 实例创建失败时的重试次数与首次退避时间（秒，按指数增长）
+    CREATE_ATTEMPTS = 3
+    CREATE_BACKOFF = 1.0
+    # 存活时间抖动比例：每个实例的实际上限在 [1 - AGE_JITTER, 1] × max_age_seconds 之间
+    AGE_JITTER = 0.2
+    
+    def __init__(
+        self,
+        size: int = 8,
+        headless: bool = True,
+        max_uses: Optional[int] = 200,
+        max_age_seconds: Optional[float] = 1800,
+        disable_media: bool = False,
+        block_assets: bool = False
+    ):
         """
         初始化浏览器池
         
         参数:
             size (int): 池大小（浏览器实例数量）
             headless (bool): 是否无头模式
+            max_uses (int): 单个实例最多借出次数，达到后关闭并在后台替换（None 表示不限）
+            max_age_seconds (float): 单个实例最长存活时间（秒），超过后关闭并替换（None 表示不限）；
+                每个实例在此基础上随机提前最多 AGE_JITTER，错开同批实例的回收时间
+            disable_media (bool): 是否禁止加载图片和自动播放媒体（只提取文本/链接时可开启）
+            block_assets (bool): 是否通过 CDP 拦截图片、字体、音视频请求（保留 CSS/JS，选择器不受影响）
         """
         self.size = size
         self.headless = headless
-        self._pool: queue.Queue = queue.Queue()
+        self.max_uses = max_uses
+        self.max_age_seconds = max_age_seconds
+        self.disable_media = disable_media
+        self.block_assets = block_assets
+        # 空闲实例：deque 的 append/pop 本身线程安全，信号量计数可用实例
+        self._pool: deque = deque()
+        self._available = threading.Semaphore(0)
         self._all_browsers: List[WebDriver] = []
         self._lock = threading.Lock()
         self._initialized = False
+        self._init_futures: List[Future] = []
+        # 预热与后台替换共用的有界线程池（close_all 时关闭），以及多次重试仍创建失败、待补充的实例数
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._missing = 0
+        # acquire() 借出、尚未 release() 的实例（按 id(driver) 索引）
+        self._borrowed: Dict[int, PooledDriver] = {}
+        # 按线程绑定的实例（get_browser_for_worker），generation 用于识别 close_all 之前的旧绑定
+        self._local = threading.local()
+        self._generation = 0
     
-    def initialize(self) -> None:
+    def initialize(self, wait: bool = True) -> None:
         """
         预创建浏览器实例填充池
         比按需创建更快，因为可以并行初始化
-        """
-        if self._initialized:
-            return
-        
-        print(f"🌐 正在预热浏览器池 ({self.size} 个实例)...")
         
-        # 并行创建浏览器实例
-        def create_browser():
-            driver = get_driver(headless=self.headless)
-            with self._lock:
-                self._all_browsers.append(driver)
-                self._pool.put(driver)
-        
-        threads = []
-        for _ in range(self.size):
-            t = threading.Thread(target=create_browser)
-            t.start()
-            threads.append(t)
-        
-        for t in threads:
-            t.join()
+        参数:
+            wait (bool): 是否等待全部实例创建完成；
+                False 时在后台创建并立即返回，每个实例就绪后即可被借出
+        """
+        with self._lock:
+            if not self._initialized:
+                self._initialized = True
+                logger.info("🌐 正在预热浏览器池 (%d 个实例)...", self.size)
+                
+                executor = self._get_executor()
+                self._init_futures = [
+                    executor.submit(self._add_browser, self._generation) for _ in range(self.size)
+                ]
+            futures = self._init_futures
         
-        self._initialized = True
-        print(f"✅ 浏览器池预热完成")
+        if wait and futures:
+            concurrent.futures.wait(futures)
+            logger.info("✅ 浏览器池预热完成")
     
     @contextmanager
-    def get_browser(self, timeout: float = 30):
+    def get_browser(self, timeout: float = 30, dirty: bool = True):
         """
         从池中获取浏览器实例（上下文管理器）
         
         参数:
             timeout (float): 等待超时时间（秒）
+            dirty (bool): 本次使用是否可能留下额外窗口、cookies 或本地存储；
+                只读取公开页面时可传 False，归还时跳过清理，省去几次 WebDriver 往返。
+                借出期间未调用 driver.get() 时同样跳过清理
         
         用法:
             with pool.get_browser() as driver:
                 driver.get(url)
         """
-        # 确保池已初始化
+        # 确保池已初始化：后台创建实例，第一个就绪的实例即可借出，不必等全部预热完成
         if not self._initialized:
-            self.initialize()
+            self.initialize(wait=False)
         
-        driver = None
+        entry = None
         try:
-            driver = self._pool.get(timeout=timeout)
-            yield driver
+            entry = self._acquire(timeout)
+            yield entry.driver
         finally:
-            if driver:
-                # 清理浏览器状态后归还
-                try:
-                    # 关闭所有额外窗口，只保留主窗口
-                    if len(driver.window_handles) > 1:
-                        main_window = driver.window_handles[0]
-                        for handle in driver.window_handles[1:]:
-                            driver.switch_to.window(handle)
-                            driver.close()
-                        driver.switch_to.window(main_window)
-                    
-                    # 清除 cookies 和本地存储
-                    driver.delete_all_cookies()
-                except:
-                    pass
-                
-                self._pool.put(driver)
+            if entry:
+                self._give_back(entry, dirty)
+    
+    def get_browser_for_worker(self, timeout: float = 30) -> WebDriver:
+        """
+        获取绑定到当前线程的浏览器实例
+        
+        每个工作线程第一次调用时从池中借出一个实例并独占，之后的调用直接返回该实例，
+        不再经过信号量/队列，适合线程池中每个线程反复处理 URL 的场景。
+        实例在 release_worker_browser() 或 close_all() 时才归还/关闭，
+        期间不做清理，也不参与按使用次数的回收
+        
+        参数:
+            timeout (float): 首次借出时的等待超时时间（秒）
+        
+        用法:
+            def task(item):
+                driver = pool.get_browser_for_worker()
+                driver.get(item["link"])
+        """
+        bound = getattr(self._local, "bound", None)
+        if bound is not None and bound[0] == self._generation:
+            return bound[1].driver
+        
+        if not self._initialized:
+            self.initialize(wait=False)
+        entry = self._acquire(timeout)
+        self._local.bound = (self._generation, entry)
+        return entry.driver
+    
+    def release_worker_browser(self, dirty: bool = True) -> None:
+        """
+        归还当前线程绑定的浏览器实例（线程不再需要浏览器时调用）
+        
+        参数:
+            dirty (bool): 归还前是否清理窗口、cookies 和本地存储
+        """
+        bound = getattr(self._local, "bound", None)
+        self._local.bound = None
+        if bound is not None and bound[0] == self._generation:
+            self._give_back(bound[1], dirty)
+    
+    def acquire(self) -> WebDriver:
+        """
+        借出一个实例（无法使用上下文管理器时调用，用完后调用 release() 归还）
+        
+        有空闲实例时直接取用，否则立即现场创建一个，不等待预热；
+        归还时若空闲实例已有 size 个，多出的实例直接关闭
+        
+        返回:
+            WebDriver: 可用的浏览器实例
+        """
+        try:
+            entry = self._acquire(timeout=0)
+        except queue.Empty:
+            generation = self._generation
+            entry = self._new_entry(
+                get_driver(headless=self.headless, disable_media=self.disable_media), generation
+            )
+            with self._lock:
+                self._all_browsers.append(entry.driver)
+        with self._lock:
+            self._borrowed[id(entry.driver)] = entry
+        return entry.driver
+    
+    def release(self, driver: WebDriver, dirty: bool = True, discard: bool = False) -> None:
+        """
+        归还 acquire() 借出的实例
+        
+        参数:
+            driver (WebDriver): acquire() 返回的实例；不是本池借出（或借出后池已关闭）的实例直接关闭
+            dirty (bool): 归还前是否清理窗口、cookies 和本地存储
+            discard (bool): 是否直接关闭该实例而不放回池中（实例已损坏或不宜复用时使用）
+        """
+        with self._lock:
+            entry = self._borrowed.pop(id(driver), None)
+            if entry is not None and discard and driver in self._all_browsers:
+                self._all_browsers.remove(driver)
+        if entry is None or discard:
+            try:
+                close_driver(driver)
+            except _DRIVER_ERRORS:
+                pass
+            return
+        self._give_back(entry, dirty)
+    
+    @property
+    def idle(self) -> int:
+        """
+        当前空闲（可立即借出）的实例数
+        """
+        return len(self._pool)
+    
+    def _give_back(self, entry: PooledDriver, dirty: bool) -> None:
+        """
+        清理浏览器状态后归还；清理失败（实例已失效）或使用次数、存活时间超限的实例在后台替换
+        """
+        healthy = self._cleanup(entry.driver) if dirty and entry.navigated else True
+        entry.navigated = False
+        entry.uses += 1
+        if not healthy or self._expired(entry):
+            self._replace(entry)
+        else:
+            self._release(entry)
+    
+    def _cleanup(self, driver: WebDriver) -> bool:
+        """
+        清理浏览器状态：关闭额外窗口，清除 cookies 和本地存储
+        
+        返回:
+            bool: 是否清理成功；失败说明实例已不可用，不应放回池中
+        """
+        try:
+            # 关闭所有额外窗口，只保留主窗口（window_handles 只查询一次）
+            handles = driver.window_handles
+            if len(handles) > 1:
+                for handle in handles[1:]:
+                    try:
+                        driver.switch_to.window(handle)
+                        driver.close()
+                    except NoSuchWindowException:
+                        pass  # 窗口已被页面自行关闭
+                driver.switch_to.window(handles[0])
+            
+            # 清除本地存储；只剩一个窗口时通常已在主窗口，不必切换，
+            # 除非调用方关闭了当前窗口却没切回
+            try:
+                driver.execute_script(_CLEAR_STORAGE_JS)
+            except NoSuchWindowException:
+                driver.switch_to.window(handles[0])
+                driver.execute_script(_CLEAR_STORAGE_JS)
+            
+            # 一条 CDP 命令清除所有域名的 cookies（delete_all_cookies 只清当前域名）；
+            # 非 Chrome 浏览器没有 execute_cdp_cmd，退回 delete_all_cookies
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except AttributeError:
+                driver.delete_all_cookies()
+            return True
+        except _DRIVER_ERRORS:
+            return False
+    
+    def _expired(self, entry: PooledDriver) -> bool:
+        """
+        判断实例是否需要回收（Chrome 长时间运行会积累缓存和内存）
+        """
+        if self.max_uses and entry.uses >= self.max_uses:
+            return True
+        if entry.max_age and time.monotonic() - entry.created >= entry.max_age:
+            return True
+        return False
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        获取创建/替换实例用的有界线程池（调用方需持有 self._lock）
+        
+        同时拉起的 Chrome 进程数不超过线程数，避免批量过期或预热时造成 CPU/内存尖峰
+        """
+        if self._executor is None:
+            max_workers = min(self.size, (os.cpu_count() or 1) * 2)
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="browser-pool")
+        return self._executor
+    
+    def _refill(self) -> None:
+        """
+        补充之前多次重试仍创建失败的实例，避免池永久缩小（借出实例时调用）
+        """
+        with self._lock:
+            if not self._missing or not self._initialized:
+                return
+            count, self._missing = self._missing, 0
+            executor = self._get_executor()
+            for _ in range(count):
+                executor.submit(self._add_browser, self._generation)
+    
+    def _replace(self, entry: PooledDriver) -> None:
+        """
+        关闭旧实例并在后台创建新实例放回池中，不阻塞归还方
+        
+        替换任务提交到有界线程池，多个实例同时过期时排队执行；
+        close_all 之前借出的旧实例只关闭，不再补充
+        """
+        def worker():
+            try:
+                close_driver(entry.driver)
+            except _DRIVER_ERRORS:
+                pass
+            self._add_browser(entry.generation)
+        
+        with self._lock:
+            if entry.driver in self._all_browsers:
+                self._all_browsers.remove(entry.driver)
+            if entry.generation == self._generation and self._initialized:
+                self._get_executor().submit(worker)
+                return
+        try:
+            close_driver(entry.driver)
+        except _DRIVER_ERRORS:
+            pass
+    
+    def _add_browser(self, generation: int) -> None:
+        """
+        创建一个浏览器实例并放入池中
+        
+        创建期间池被关闭（代数已变化）或池已满时直接丢弃，避免旧实例混入新池、实例数超过 size
+        
+        失败时按指数退避重试 CREATE_ATTEMPTS 次；仍失败则记入待补充数，下次借出实例时再尝试
+        
+        参数:
+            generation (int): 发起创建时池的代数
+        """
+        driver = None
+        for attempt in range(self.CREATE_ATTEMPTS):
+            if generation != self._generation:
+                return
+            try:
+                driver = get_driver(headless=self.headless, disable_media=self.disable_media)
+                break
+            except Exception as e:
+                logger.warning("⚠️ 浏览器实例创建失败 (%d/%d): %s", attempt + 1, self.CREATE_ATTEMPTS, e)
+                if attempt + 1 < self.CREATE_ATTEMPTS:
+                    time.sleep(self.CREATE_BACKOFF * 2 ** attempt)
+        if driver is None:
+            with self._lock:
+                if generation == self._generation:
+                    self._missing += 1
+            return
+        entry = self._new_entry(driver, generation)
+        with self._lock:
+            keep = (
+                generation == self._generation
+                and self._initialized
+                and len(self._all_browsers) < self.size
+            )
+            if keep:
+                self._all_browsers.append(driver)
+                self._pool.append(entry)
+                self._available.release()
+        if not keep:
+            close_driver(driver)
+    
+    def _new_entry(self, driver: WebDriver, generation: int) -> PooledDriver:
+        """
+        为新创建的实例配置资源拦截、导航跟踪，并生成带随机存活上限的池条目
+        """
+        if self.block_assets:
+            _enable_asset_blocking(driver)
+        max_age = None
+        if self.max_age_seconds:
+            max_age = self.max_age_seconds * random.uniform(1 - self.AGE_JITTER, 1)
+        entry = PooledDriver(driver, generation=generation, max_age=max_age)
+        _track_navigation(entry)
+        return entry
+    
+    def _acquire(self, timeout: float) -> PooledDriver:
+        """
+        取出一个空闲实例，超时抛出 queue.Empty（与原 Queue 实现保持一致）
+        
+        按 LIFO 顺序取出最近归还的实例，其 DNS/TLS 会话和浏览器缓存最热
+        """
+        self._refill()
+        if not self._available.acquire(timeout=timeout):
+            raise queue.Empty
+        with self._lock:
+            # 等待期间 close_all 清空了池（信号量已被替换），按超时处理
+            if not self._pool:
+                raise queue.Empty
+            return self._pool.pop()
+    
+    def _release(self, entry: PooledDriver) -> None:
+        """
+        归还实例到池中；close_all 之前借出的旧实例，以及空闲实例已满 size 个时多出的实例直接关闭
+        """
+        with self._lock:
+            if entry.generation == self._generation and len(self._pool) < self.size:
+                self._pool.append(entry)
+                self._available.release()
+                return
+            if entry.driver in self._all_browsers:
+                self._all_browsers.remove(entry.driver)
+        try:
+            close_driver(entry.driver)
+        except _DRIVER_ERRORS:
+            pass
     
     def close_all(self) -> None:
         """
         关闭所有浏览器实例
         """
-        print("🔒 正在关闭浏览器池...")
-        for driver in self._all_browsers:
+        logger.info("🔒 正在关闭浏览器池...")
+        with self._lock:
+            browsers = list(self._all_browsers)
+            self._all_browsers.clear()
+            self._pool.clear()
+            self._available = threading.Semaphore(0)
+            self._initialized = False
+            self._init_futures = []
+            self._missing = 0
+            self._borrowed.clear()
+            self._generation += 1
+            executor, self._executor = self._executor, None
+        if executor:
+            # 不等待排队中的创建任务：它们会因代数变化而丢弃实例
+            executor.shutdown(wait=False)
+        for driver in browsers:
             try:
                 close_driver(driver)
-            except:
+            except _DRIVER_ERRORS:
                 pass
-        self._all_browsers.clear()
-        self._initialized = False
-        print("✅ 浏览器池已关闭")
+        logger.info("✅ 浏览器池已关闭")
+
+
+def _track_navigation(entry: PooledDriver) -> None:
+    """
+    包装实例的 driver.get()，调用时标记 entry.navigated，归还时据此决定是否需要清理
+    """
+    original_get = entry.driver.get
+    
+    def get(url: str) -> None:
+        entry.navigated = True
+        original_get(url)
+    
+    entry.driver.get = get
+
+
+def _enable_asset_blocking(driver: WebDriver) -> bool:
+    """
+    通过 CDP Network.setBlockedURLs 拦截图片、字体、音视频请求
+    
+    返回:
+        bool: 是否启用成功（非 Chrome 浏览器不支持 CDP，返回 False）
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_ASSET_PATTERNS})
+        return True
+    except (WebDriverException, AttributeError):
+        return False
+
+
+def _wait(driver: WebDriver, timeout: float, poll_frequency: float = 0.5) -> WebDriverWait:
+    """
+    获取该 driver 对应超时/轮询间隔的 WebDriverWait（缓存在 driver 上复用，避免每次调用重新构造）
+    """
+    try:
+        cache = driver._wait_cache
+    except AttributeError:
+        cache = driver._wait_cache = {}
+    key = (timeout, poll_frequency)
+    wait = cache.get(key)
+    if wait is None:
+        wait = cache[key] = WebDriverWait(driver, timeout, poll_frequency=poll_frequency)
+    return wait
 
 
 def wait_for_new_window(
     driver: WebDriver, 
-    original_handles: set,
+    original_handles: Collection[str],
     timeout: float = 10,
-    poll_interval: float = 0.5
+    poll_interval: float = 0.05
 ) -> Optional[str]:
     """
     等待新窗口打开
     
+    每次轮询只发一条 window_handles 命令，检测到新句柄时直接返回，不再额外查询一次
+    
     参数:
         driver: WebDriver 实例
-        original_handles: 原始窗口句柄集合
+        original_handles: 原始窗口句柄（tuple/list/set 均可）
         timeout (float): 超时时间（秒）
         poll_interval (float): 轮询间隔（秒）
     
     返回:
         str: 新窗口句柄，如果超时返回 None
     """
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        current_handles = set(driver.window_handles)
-        new_handles = current_handles - original_handles
-        if new_handles:
-            return new_handles.pop()
-        time.sleep(poll_interval)
-    return None
+    def find_new_handle(d: WebDriver) -> Optional[str]:
+        # 句柄通常只有 1~3 个，线性查找比构造集合求差集更省
+        for handle in d.window_handles:
+            if handle not in original_handles:
+                return handle
+        return None
+    
+    try:
+        return _wait(driver, timeout, poll_interval).until(find_new_handle)
+    except TimeoutException:
+        return None
+
+
+def _wait_ready(driver: WebDriver, timeout: float) -> bool:
+    """
+    等待当前窗口页面 DOM 解析完成（新窗口刚打开时仍是 about:blank，不算完成）
+    
+    返回:
+        bool: 是否在超时前加载完成
+    """
+    try:
+        _wait(driver, timeout, 0.1).until(
+            lambda d: d.execute_script(_PAGE_READY_JS)
+        )
+        return True
+    except (TimeoutException, WebDriverException):
+        return False
+
+
+def _wait_url_stable(driver: WebDriver, min_stable: float = 0.2, timeout: float = 5) -> str:
+    """
+    等待 current_url 稳定（JS 跳转结束），连续 min_stable 秒不变即返回
+    
+    返回:
+        str: 稳定后的 URL；超时则返回最后一次读到的 URL
+    """
+    deadline = time.monotonic() + timeout
+    url = driver.current_url
+    stable_since = time.monotonic()
+    while True:
+        now = time.monotonic()
+        if now - stable_since >= min_stable or now >= deadline:
+            return url
+        time.sleep(0.1)
+        current = driver.current_url
+        if current != url:
+            url = current
+            stable_since = time.monotonic()
+
+
+def _static_href(element) -> Optional[str]:
+    """
+    获取元素可直接访问的 href；无 href、锚点或 javascript: 链接返回 None
+    """
+    try:
+        href = element.get_attribute("href")
+    except WebDriverException:
+        return None
+    if not href or href == "#" or href.endswith("#"):
+        return None
+    if href.lower().startswith("javascript:"):
+        return None
+    return href
 
 
 def safe_click(driver: WebDriver, element, use_js: bool = True) -> bool:
@@ -199,7 +676,7 @@ def wait_and_get_text(
         str: 元素文本或默认值
     """
     try:
-        element = WebDriverWait(driver, timeout).until(
+        element = _wait(driver, timeout).until(
             EC.presence_of_element_located(locator)
         )
         return element.text.strip()
@@ -228,7 +705,7 @@ def wait_and_get_attribute(
         str: 属性值或默认值
     """
     try:
-        element = WebDriverWait(driver, timeout).until(
+        element = _wait(driver, timeout).until(
             EC.presence_of_element_located(locator)
         )
         return element.get_attribute(attribute) or default
@@ -236,6 +713,115 @@ def wait_and_get_attribute(
         return default
 
 
+def get_many(
+    driver: WebDriver,
+    locators: Dict[str, tuple],
+    timeout: float = 0,
+    default: str = "N/A"
+) -> Dict[str, str]:
+    """
+    一次 execute_script 批量提取多个字段（N 个字段只需 1 次 WebDriver 往返）
+    
+    参数:
+        driver: WebDriver 实例
+        locators: {字段名: (By.XXX, 选择器)} 取文本，或 {字段名: (By.XXX, 选择器, 属性名)} 取属性；
+            支持 CSS_SELECTOR / XPATH / ID / CLASS_NAME / TAG_NAME / NAME
+        timeout (float): 大于 0 时，批量未取到的字段再逐个用 wait_and_get_* 等待
+        default (str): 默认值
+    
+    返回:
+        dict: {字段名: 文本或属性值}
+    
+    使用示例:
+        >>> get_many(driver, {
+        ...     "title": (By.CSS_SELECTOR, "h1"),
+        ...     "apply": (By.XPATH, "//a[contains(text(), 'Apply')]", "href"),
+        ... })
+    """
+    names = list(locators)
+    specs = []
+    for name in names:
+        by, selector, *rest = locators[name]
+        if by == By.XPATH:
+            specs.append({"xpath": selector, "attr": rest[0] if rest else None})
+        else:
+            specs.append({"css": _to_css(by, selector), "attr": rest[0] if rest else None})
+    
+    try:
+        values = driver.execute_script(_GET_MANY_JS, specs)
+    except WebDriverException:
+        values = [None] * len(names)
+    
+    result = {}
+    for name, value in zip(names, values):
+        if value:
+            result[name] = value
+        elif timeout > 0:
+            # 元素可能尚未渲染，退回逐个等待
+            by, selector, *rest = locators[name]
+            if rest:
+                result[name] = wait_and_get_attribute(driver, (by, selector), rest[0], timeout, default)
+            else:
+                result[name] = wait_and_get_text(driver, (by, selector), timeout, default)
+        else:
+            result[name] = default
+    return result
+
+
+def execute_many(driver: WebDriver, scripts: List[Union[str, tuple]]) -> list:
+    """
+    在一次 execute_script 中依次执行多段脚本，返回各自的结果（N 段脚本只需 1 次 WebDriver 往返）
+    
+    参数:
+        driver: WebDriver 实例
+        scripts: 脚本列表，每项为脚本字符串，或 (脚本, 参数1, 参数2, ...) 元组；
+            写法与 execute_script 相同（用 return 返回值，用 arguments[i] 取参数）
+    
+    返回:
+        list: 与 scripts 一一对应的结果；单段脚本出错时对应结果为 None
+    
+    使用示例:
+        >>> url, title, href = execute_many(driver, [
+        ...     "return location.href;",
+        ...     "return document.title;",
+        ...     ("return arguments[0].href;", element),
+        ... ])
+    """
+    if not scripts:
+        return []
+    
+    bodies = []
+    args = []
+    for item in scripts:
+        if isinstance(item, str):
+            item = (item,)
+        bodies.append(item[0])
+        args.append(list(item[1:]))
+    
+    # 拼成一段脚本而不是在页面里 eval，避免被站点的 CSP 拦截
+    parts = [
+        f"(function(){{try{{return (function(){{{body}\n}}).apply(null, a[{i}]);}}catch(e){{return null;}}}})()"
+        for i, body in enumerate(bodies)
+    ]
+    script = "var a = arguments[0];\nreturn [" + ",\n".join(parts) + "];"
+    return driver.execute_script(script, args)
+
+
+def _to_css(by: str, selector: str) -> str:
+    """
+    把 ID / CLASS_NAME / NAME / TAG_NAME 定位器转换为 CSS 选择器
+    """
+    if by == By.CSS_SELECTOR or by == By.TAG_NAME:
+        return selector
+    if by == By.ID:
+        return f'[id="{selector}"]'
+    if by == By.CLASS_NAME:
+        return f".{selector}"
+    if by == By.NAME:
+        return f'[name="{selector}"]'
+    raise ValueError(f"get_many 不支持的定位方式: {by}")
+
+
 def switch_to_new_window_and_get_url(
     driver: WebDriver,
     click_element,
@@ -251,41 +837,83 @@ def switch_to_new_window_and_get_url(
         driver: WebDriver 实例
         click_element: 要点击的元素
         timeout (float): 等待新窗口超时
-        wait_for_load (float): 等待页面加载时间
+        wait_for_load (float): 等待页面加载的最长时间
     
     返回:
         str: 新窗口的 URL，失败返回 None
     """
-    original_handles = set(driver.window_handles)
-    main_window = driver.current_window_handle
+    # 普通 <a href> 链接直接返回 href，省去点击、切换窗口和等待加载
+    href = _static_href(click_element)
+    if href:
+        return href
     
-    # 点击元素
-    safe_click(driver, click_element)
-    
-    # 等待新窗口
-    new_handle = wait_for_new_window(driver, original_handles, timeout)
+    main_window = driver.current_window_handle
     
-    if new_handle:
+    try:
+        url, _ = _click_open_read_close(driver, click_element, timeout, wait_for_load)
+        if url is not None:
+            # 新窗口已关闭，回到原窗口
+            driver.switch_to.window(main_window)
+        return url
+    except _DRIVER_ERRORS:
+        # 确保回到主窗口
         try:
-            driver.switch_to.window(new_handle)
-            time.sleep(wait_for_load)  # 等待页面加载
-            url = driver.current_url
-            
-            # 关闭新窗口，回到原窗口
-            driver.close()
             driver.switch_to.window(main_window)
-            
-            return url
-        except:
-            # 确保回到主窗口
-            try:
-                driver.switch_to.window(main_window)
-            except:
-                pass
+        except _DRIVER_ERRORS:
+            pass
     
     return None
 
 
+def _click_open_read_close(
+    driver: WebDriver,
+    element,
+    timeout: float,
+    wait_for_load: float,
+    close: bool = True,
+    opened: Optional[List[str]] = None
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    点击元素 -> 等待新窗口 -> 切换过去 -> 等页面加载并读取 URL -> 关闭该窗口
+    
+    调用后当前窗口是新窗口（close=True 时该窗口已关闭），由调用方负责切回原窗口
+    
+    参数:
+        driver: WebDriver 实例
+        element: 要点击的元素
+        timeout (float): 等待新窗口超时
+        wait_for_load (float): 等待页面加载的最长时间
+        close (bool): 读取 URL 后是否关闭新窗口
+        opened (list): 可选，记录尚未关闭的新窗口句柄，便于调用方出错时清理
+    
+    返回:
+        tuple: (新窗口 URL, 仍打开的新窗口句柄)；没有新窗口时返回 (None, None)
+    """
+    original_handles = tuple(driver.window_handles)
+    safe_click(driver, element)
+    
+    new_handle = wait_for_new_window(driver, original_handles, timeout)
+    if not new_handle:
+        return None, None
+    
+    if opened is not None:
+        opened.append(new_handle)
+    driver.switch_to.window(new_handle)
+    # 等待页面加载并等 URL 稳定（页面加载完即返回，不再固定等待）；
+    # 两步共用 wait_for_load 的时间预算，最坏情况不超过一次 wait_for_load
+    deadline = time.monotonic() + wait_for_load
+    _wait_ready(driver, wait_for_load)
+    url = _wait_url_stable(driver, timeout=max(0.0, deadline - time.monotonic()))
+    
+    if not close:
+        return url, new_handle
+    
+    driver.close()
+    if opened is not None:
+        opened.remove(new_handle)
+    return url, None
+
+
 def extract_final_apply_url(
     driver: WebDriver,
     apply_button_locator: tuple,
@@ -310,73 +938,71 @@ def extract_final_apply_url(
     """
     main_window = driver.current_window_handle
     final_url = "N/A"
+    # 本次流程打开且尚未关闭的窗口，清理时直接使用，不再查询 window_handles
+    opened: List[str] = []
+    new_handle = None
     
     try:
         # Step 1: 点击 Apply Now 按钮
-        apply_btn = WebDriverWait(driver, timeout).until(
+        apply_btn = _wait(driver, timeout).until(
             EC.element_to_be_clickable(apply_button_locator)
         )
         
-        original_handles = set(driver.window_handles)
-        safe_click(driver, apply_btn)
+        # 没有中间步骤时，普通 <a href> 按钮的 href 就是结果，无需打开新窗口
+        if not intermediate_link_locator:
+            href = _static_href(apply_btn)
+            if href:
+                return href
         
-        # 等待第一个新窗口
-        new_handle = wait_for_new_window(driver, original_handles, timeout)
+        # 点击后切换到新窗口（说明页），保持打开以便继续下一步
+        page_url, new_handle = _click_open_read_close(
+            driver, apply_btn, timeout, timeout, close=False, opened=opened
+        )
         
         if not new_handle:
             # 没有新窗口，尝试获取按钮的 href
             return apply_btn.get_attribute("href") or "N/A"
         
-        # 切换到新窗口（说明页）
-        driver.switch_to.window(new_handle)
-        time.sleep(1)
-        
         # Step 2: 如果有中间链接，点击它
         if intermediate_link_locator:
             try:
-                intermediate_btn = WebDriverWait(driver, 5).until(
+                intermediate_btn = _wait(driver, 5).until(
                     EC.element_to_be_clickable(intermediate_link_locator)
                 )
                 
-                # 记录当前窗口数
-                handles_before_click = set(driver.window_handles)
-                
-                # 点击中间链接
-                safe_click(driver, intermediate_btn)
-                
-                # 等待可能的新窗口（申请系统页面）
-                final_handle = wait_for_new_window(driver, handles_before_click, timeout=5)
+                # 点击中间链接，读取可能打开的申请系统窗口 URL 后关闭它
+                url, _ = _click_open_read_close(
+                    driver, intermediate_btn, 5, timeout, opened=opened
+                )
                 
-                if final_handle:
-                    # 新窗口打开了，获取 URL
-                    driver.switch_to.window(final_handle)
-                    time.sleep(1)
-                    final_url = driver.current_url
-                    driver.close()
+                if url is not None:
+                    final_url = url
                 else:
-                    # 没有新窗口，当前页面就是申请页
-                    time.sleep(1)
-                    final_url = driver.current_url
+                    # 没有新窗口，当前页面就是申请页（可能仍在跳转）
+                    final_url = _wait_url_stable(driver, timeout=timeout)
                     
             except (TimeoutException, NoSuchElementException):
-                # 没找到中间链接，当前页面 URL 作为结果
-                final_url = driver.current_url
+                # 没找到中间链接，说明页 URL 作为结果
+                final_url = page_url
         else:
-            # 没有中间链接，直接获取当前 URL
-            final_url = driver.current_url
+            # 没有中间链接，说明页 URL 即结果
+            final_url = page_url
         
-    except Exception as e:
+    except _DRIVER_ERRORS:
         pass
     finally:
-        # 清理：关闭所有额外窗口，回到主窗口
+        # 清理：关闭本次打开的窗口，回到主窗口
         try:
-            current_handles = driver.window_handles
-            for handle in current_handles:
-                if handle != main_window:
+            for handle in reversed(opened):
+                try:
                     driver.switch_to.window(handle)
                     driver.close()
-            driver.switch_to.window(main_window)
-        except:
+                except NoSuchWindowException:
+                    pass  # 窗口已被页面自行关闭
+            # 从未离开主窗口（href 直接返回、没有新窗口等）时不必切换
+            if new_handle or opened:
+                driver.switch_to.window(main_window)
+        except _DRIVER_ERRORS:
             pass
     
     return final_url